@@ -19,6 +19,9 @@ class RAGSystem:
         self.ai_generator = AIGenerator(config.ANTHROPIC_API_KEY, config.ANTHROPIC_MODEL)
         self.session_manager = SessionManager(config.MAX_HISTORY)
         
+        # Cached course titles, invalidated whenever the catalog changes
+        self._course_titles: Optional[Tuple[str, ...]] = None
+        
         # Initialize search tools
         self.tool_manager = ToolManager()
         self.search_tool = CourseSearchTool(self.vector_store)
@@ -40,6 +43,7 @@ class RAGSystem:
             
             # Add course metadata to vector store for semantic search
             self.vector_store.add_course_metadata(course)
+            self._course_titles = None
             
             # Add course content chunks to vector store
             self.vector_store.add_course_content(course_chunks)
@@ -67,6 +71,7 @@ class RAGSystem:
         if clear_existing:
             print("Clearing existing data for fresh rebuild...")
             self.vector_store.clear_all_data()
+            self._course_titles = None
         
         if not os.path.exists(folder_path):
             print(f"Folder {folder_path} does not exist")
@@ -87,6 +92,7 @@ class RAGSystem:
                     if course and course.title not in existing_course_titles:
                         # This is a new course - add it to the vector store
                         self.vector_store.add_course_metadata(course)
+                        self._course_titles = None
                         self.vector_store.add_course_content(course_chunks)
                         total_courses += 1
                         total_chunks += len(course_chunks)
@@ -140,8 +146,15 @@ class RAGSystem:
         return response, sources
     
     def get_course_analytics(self) -> Dict:
-        """Get analytics about the course catalog"""
+        """Get analytics about the course catalog (cached until the catalog changes)"""
+        if self._course_titles is None:
+            # A single catalog scan yields both the titles and the count
+            course_titles = self.vector_store.get_existing_course_titles()
+            if not course_titles:
+                # Read errors also come back empty, so never cache an empty scan
+                return {"total_courses": 0, "course_titles": []}
+            self._course_titles = tuple(course_titles)
         return {
-            "total_courses": self.vector_store.get_course_count(),
-            "course_titles": self.vector_store.get_existing_course_titles()
+            "total_courses": len(self._course_titles),
+            "course_titles": list(self._course_titles)
         }
\ No newline at end of file
@@ -1,44 +1,15 @@
 """Pytest configuration and shared fixtures for testing."""
 
+import importlib
+import os
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
-import os
-import tempfile
-import shutil
-from pathlib import Path
-
-# Add the backend directory to the Python path
-import sys
-backend_path = Path(__file__).parent.parent / "backend"
-sys.path.insert(0, str(backend_path))
-
-from app import app
-from config import Config
-from rag_system import RAGSystem
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
-
-
-@pytest.fixture
-async def async_client():
-    """Create an async test client for the FastAPI app."""
-    from httpx import ASGITransport
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        yield ac
+from types import ModuleType
 
 
-@pytest.fixture
-def temp_docs_dir():
-    """Create a temporary directory with sample course documents."""
-    temp_dir = tempfile.mkdtemp()
-    
-    # Create a sample course document
-    sample_doc = """Course Title: Sample Course
+SAMPLE_DOC = """Course Title: Sample Course
 Course Link: https://example.com/course
 Course Instructor: Test Instructor
 
@@ -50,32 +21,79 @@ Lesson 2: Advanced Testing
 Lesson Link: https://example.com/lesson2
 This is the content of lesson 2. It covers advanced testing techniques.
 """
-    
-    with open(os.path.join(temp_dir, "sample_course.txt"), "w") as f:
-        f.write(sample_doc)
-    
-    yield temp_dir
-    
-    # Cleanup
-    shutil.rmtree(temp_dir)
+
+# Where the app_module fixture stashes the imported app for other fixtures
+APP_MODULE_KEY = pytest.StashKey[ModuleType]()
+
+
+@pytest.fixture(scope="session")
+def worker_chroma_path(tmp_path_factory):
+    """Give each test worker its own ChromaDB directory before the app is imported."""
+    # pytest-xdist runs one session per worker; plain runs use a single "main" worker
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    config = importlib.import_module("config").config
+    config.CHROMA_PATH = str(tmp_path_factory.mktemp(f"chroma_{worker_id}"))
+    return config.CHROMA_PATH
+
+
+@pytest.fixture(scope="session")
+def app_module(request, worker_chroma_path):
+    """Import the FastAPI app module once, only for tests that need it."""
+    # Importing here keeps anthropic/chromadb/sentence-transformers out of
+    # model-only runs and makes --durations attribute the cost to this fixture
+    module = importlib.import_module("app")
+    request.config.stash[APP_MODULE_KEY] = module
+    return module
+
+
+@pytest.fixture(scope="session")
+def client(app_module):
+    """Create a test client for the FastAPI app, shared across the session."""
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(app_module):
+    """Create the ASGI transport for the FastAPI app, shared across the session."""
+    from httpx import ASGITransport
+    return ASGITransport(app=app_module.app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(asgi_transport):
+    """Create an async test client for the FastAPI app, shared across the session."""
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(autouse=True)
+def reset_app_state(request):
+    """Reset mutable app state so tests stay isolated with shared clients."""
+    # Only touch the app if a test has already imported it
+    app_module = request.config.stash.get(APP_MODULE_KEY, None)
+    if app_module is not None:
+        session_manager = app_module.rag_system.session_manager
+        session_manager.sessions.clear()
+        session_manager.session_counter = 0
+    yield
 
 
 @pytest.fixture
+def temp_docs_dir(tmp_path):
+    """Create a temporary directory with sample course documents."""
+    (tmp_path / "sample_course.txt").write_text(SAMPLE_DOC)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
 def mock_config():
-    """Create a test configuration."""
+    """Create a test configuration, shared across the session (treat as read-only)."""
+    Config = importlib.import_module("config").Config
     return Config(
-        anthropic_api_key="test-key",
-        chunk_size=500,
-        chunk_overlap=50,
-        max_search_results=3,
-        max_conversation_history=2
+        ANTHROPIC_API_KEY="test-key",
+        CHUNK_SIZE=500,
+        CHUNK_OVERLAP=50,
+        MAX_RESULTS=3,
+        MAX_HISTORY=2
     )
-
-
-@pytest.fixture
-def sample_query_request():
-    """Sample query request data."""
-    return {
-        "query": "What is testing?",
-        "session_id": "test-session-123"
-    }
\ No newline at end of file
@@ -1,107 +1,139 @@
 """Tests for the FastAPI backend endpoints."""
 
 import pytest
-from unittest.mock import Mock, patch
 from fastapi import status
+from typing import Any, NamedTuple, Optional
 
+try:
+    # Faster decoding of response bodies when orjson is available
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Shared payloads reused across table rows; never mutated by tests
+QUERY_REQUEST = {"query": "What is testing?", "session_id": "test-session-123"}
+COURSE_ANALYTICS = {"total_courses": 2, "course_titles": ["Course 1", "Course 2"]}
+QUERY_RESULT = ("Testing is a process of evaluating software.", ["source1.txt", "source2.txt"])
+
+
+class EndpointCase(NamedTuple):
+    """One row of the endpoint table."""
+    method: str
+    url: str
+    expected_status: int
+    payload: Any = None           # JSON body to send
+    target: Optional[str] = None  # rag_system method to stub
+    result: Any = None            # stub return value, or an exception to raise
+    expected_body: Any = None     # full JSON body expected back
+    expected_call: Optional[tuple] = None  # positional args the stub must receive once
+
+
+ENDPOINT_CASES = [
+    pytest.param(EndpointCase(
+        method="GET",
+        url="/api/courses",
+        target="get_course_analytics",
+        result=COURSE_ANALYTICS,
+        expected_status=status.HTTP_200_OK,
+        expected_body={"total_courses": 2, "course_titles": ["Course 1", "Course 2"]},
+        expected_call=(),
+    ), id="courses-success"),
+    pytest.param(EndpointCase(
+        method="GET",
+        url="/api/courses",
+        target="get_course_analytics",
+        result=Exception("Database error"),
+        expected_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        expected_body={"detail": "Database error"},
+    ), id="courses-error"),
+    pytest.param(EndpointCase(
+        method="POST",
+        url="/api/query",
+        payload=QUERY_REQUEST,
+        target="query",
+        result=QUERY_RESULT,
+        expected_status=status.HTTP_200_OK,
+        expected_body={
+            "answer": "Testing is a process of evaluating software.",
+            "sources": ["source1.txt", "source2.txt"],
+            "session_id": "test-session-123"
+        },
+        expected_call=("What is testing?", "test-session-123"),
+    ), id="query-with-session-id"),
+    pytest.param(EndpointCase(
+        method="POST",
+        url="/api/query",
+        payload={"query": "Why is testing important?"},
+        target="query",
+        result=("Testing is important for software quality.", ["source3.txt"]),
+        expected_status=status.HTTP_200_OK,
+        expected_body={
+            "answer": "Testing is important for software quality.",
+            "sources": ["source3.txt"],
+            "session_id": "session_1"
+        },
+        expected_call=("Why is testing important?", "session_1"),
+    ), id="query-without-session-id"),
+    pytest.param(EndpointCase(
+        method="POST",
+        url="/api/query",
+        payload=QUERY_REQUEST,
+        target="query",
+        result=Exception("RAG system error"),
+        expected_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        expected_body={"detail": "RAG system error"},
+    ), id="query-error"),
+    pytest.param(EndpointCase(
+        method="POST",
+        url="/api/query",
+        payload={},
+        expected_status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ), id="query-invalid-request"),
+]
 
-class TestCourseStatsEndpoint:
-    """Test the /api/courses endpoint."""
-    
-    def test_get_course_stats_success(self, client):
-        """Test successful retrieval of course statistics."""
-        # Mock the RAG system's get_course_analytics method
-        with patch('app.rag_system.get_course_analytics') as mock_analytics:
-            mock_analytics.return_value = {
-                "total_courses": 2,
-                "course_titles": ["Course 1", "Course 2"]
-            }
-            
-            response = client.get("/api/courses")
-            
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["total_courses"] == 2
-            assert data["course_titles"] == ["Course 1", "Course 2"]
-            mock_analytics.assert_called_once()
-    
-    def test_get_course_stats_error(self, client):
-        """Test error handling in course statistics endpoint."""
-        with patch('app.rag_system.get_course_analytics') as mock_analytics:
-            mock_analytics.side_effect = Exception("Database error")
-            
-            response = client.get("/api/courses")
-            
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            assert "Database error" in response.json()["detail"]
-
-
-class TestQueryEndpoint:
-    """Test the /api/query endpoint."""
-    
-    def test_query_with_session_id(self, client, sample_query_request):
-        """Test query endpoint with provided session ID."""
-        with patch('app.rag_system.query') as mock_query:
-            mock_query.return_value = (
-                "Testing is a process of evaluating software.", 
-                ["source1.txt", "source2.txt"]
-            )
-            
-            response = client.post("/api/query", json=sample_query_request)
-            
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["answer"] == "Testing is a process of evaluating software."
-            assert data["sources"] == ["source1.txt", "source2.txt"]
-            assert data["session_id"] == "test-session-123"
-            mock_query.assert_called_once_with("What is testing?", "test-session-123")
-    
-    def test_query_without_session_id(self, client):
-        """Test query endpoint without session ID (should create new session)."""
-        with patch('app.rag_system.query') as mock_query, \
-             patch('app.rag_system.session_manager.create_session') as mock_create_session:
-            
-            mock_create_session.return_value = "new-session-456"
-            mock_query.return_value = (
-                "Testing is important for software quality.", 
-                ["source3.txt"]
-            )
-            
-            request_data = {"query": "Why is testing important?"}
-            response = client.post("/api/query", json=request_data)
-            
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["answer"] == "Testing is important for software quality."
-            assert data["sources"] == ["source3.txt"]
-            assert data["session_id"] == "new-session-456"
-            
-            mock_create_session.assert_called_once()
-            mock_query.assert_called_once_with("Why is testing important?", "new-session-456")
-    
-    def test_query_with_invalid_request(self, client):
-        """Test query endpoint with missing required fields."""
-        response = client.post("/api/query", json={})
-        
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-    
-    def test_query_error_handling(self, client, sample_query_request):
-        """Test error handling in query endpoint."""
-        with patch('app.rag_system.query') as mock_query:
-            mock_query.side_effect = Exception("RAG system error")
-            
-            response = client.post("/api/query", json=sample_query_request)
-            
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-            assert "RAG system error" in response.json()["detail"]
+
+def stub_rag_target(monkeypatch, target, result):
+    """Replace a RAG system method with a plain function returning (or raising) result."""
+    calls = []
+    if target is None:
+        return calls
+
+    def stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(f"app.rag_system.{target}", stub)
+    return calls
+
+
+def check_response(response, calls, case):
+    """Check the response and the recorded RAG system calls against a table row."""
+    assert response.status_code == case.expected_status
+    if case.expected_body is not None:
+        assert json_loads(response.content) == case.expected_body
+    if case.expected_call is not None:
+        assert calls == [(case.expected_call, {})]
+
+
+@pytest.mark.parametrize("case", ENDPOINT_CASES)
+def test_endpoint(client, monkeypatch, case):
+    """Test the API endpoints using the sync client."""
+    calls = stub_rag_target(monkeypatch, case.target, case.result)
+
+    response = client.request(case.method, case.url, json=case.payload)
+
+    check_response(response, calls, case)
 
 
 class TestPydanticModels:
     """Test the Pydantic models used in the API."""
     
-    def test_query_request_validation(self):
+    def test_query_request_validation(self, app_module):
         """Test QueryRequest model validation."""
-        from app import QueryRequest
+        QueryRequest = app_module.QueryRequest
         
         # Valid request
         valid_request = QueryRequest(query="test query", session_id="session-123")
@@ -113,9 +145,9 @@ class TestPydanticModels:
         assert minimal_request.query == "test query"
         assert minimal_request.session_id is None
     
-    def test_query_response_creation(self):
+    def test_query_response_creation(self, app_module):
         """Test QueryResponse model creation."""
-        from app import QueryResponse
+        QueryResponse = app_module.QueryResponse
         
         response = QueryResponse(
             answer="Test answer",
@@ -127,9 +159,9 @@ class TestPydanticModels:
         assert response.sources == ["source1.txt", "source2.txt"]
         assert response.session_id == "session-123"
     
-    def test_course_stats_creation(self):
+    def test_course_stats_creation(self, app_module):
         """Test CourseStats model creation."""
-        from app import CourseStats
+        CourseStats = app_module.CourseStats
         
         stats = CourseStats(
             total_courses=5,
@@ -141,39 +173,12 @@ class TestPydanticModels:
         assert "Course A" in stats.course_titles
 
 
-@pytest.mark.asyncio
-class TestAsyncEndpoints:
-    """Test endpoints using async client."""
-    
-    async def test_async_query_endpoint(self, async_client):
-        """Test query endpoint using async client."""
-        with patch('app.rag_system.query') as mock_query:
-            mock_query.return_value = (
-                "Async testing response", 
-                ["async_source.txt"]
-            )
-            
-            response = await async_client.post(
-                "/api/query", 
-                json={"query": "async test query"}
-            )
-            
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert "Async testing response" in data["answer"]
-            assert "async_source.txt" in data["sources"]
-    
-    async def test_async_courses_endpoint(self, async_client):
-        """Test courses endpoint using async client."""
-        with patch('app.rag_system.get_course_analytics') as mock_analytics:
-            mock_analytics.return_value = {
-                "total_courses": 3,
-                "course_titles": ["Async Course 1", "Async Course 2", "Async Course 3"]
-            }
-            
-            response = await async_client.get("/api/courses")
-            
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["total_courses"] == 3
-            assert len(data["course_titles"]) == 3
\ No newline at end of file
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("case", ENDPOINT_CASES)
+async def test_async_endpoint(async_client, monkeypatch, case):
+    """Test the API endpoints using the async client."""
+    calls = stub_rag_target(monkeypatch, case.target, case.result)
+
+    response = await async_client.request(case.method, case.url, json=case.payload)
+
+    check_response(response, calls, case)
@@ -0,0 +1,127 @@
+"""Tests for the course analytics cache in rag_system.py."""
+
+import importlib
+import pytest
+
+
+class FakeVectorStore:
+    """In-memory stand-in for the VectorStore course catalog."""
+
+    def __init__(self, *args, **kwargs):
+        self.titles = []
+        self.catalog_reads = 0
+        self.fail_next_read = False
+        self.fail_content_write = False
+
+    def add_course_metadata(self, course):
+        self.titles.append(course.title)
+
+    def add_course_content(self, chunks):
+        if self.fail_content_write:
+            raise RuntimeError("content write failed")
+
+    def clear_all_data(self):
+        self.titles.clear()
+
+    def get_existing_course_titles(self):
+        self.catalog_reads += 1
+        if self.fail_next_read:
+            # VectorStore swallows read errors and returns an empty list
+            self.fail_next_read = False
+            return []
+        return list(self.titles)
+
+
+def write_course(folder, title):
+    """Write a minimal course document and return its path."""
+    path = folder / f"{title.replace(' ', '_')}.txt"
+    path.write_text(
+        f"Course Title: {title}\n"
+        "Course Link: https://example.com/course\n"
+        "Course Instructor: Test Instructor\n"
+        "\n"
+        "Lesson 1: Introduction\n"
+        "Lesson Link: https://example.com/lesson1\n"
+        "This is the content of lesson 1.\n"
+    )
+    return path
+
+
+@pytest.fixture
+def rag(monkeypatch, mock_config):
+    """RAG system backed by the in-memory catalog, with no AI client."""
+    rag_system = importlib.import_module("rag_system")
+    monkeypatch.setattr(rag_system, "VectorStore", FakeVectorStore)
+    monkeypatch.setattr(rag_system, "AIGenerator", lambda *args: None)
+    return rag_system.RAGSystem(mock_config)
+
+
+class TestCourseAnalyticsCache:
+    """Test caching and invalidation of course analytics."""
+
+    def test_cache_hit(self, rag):
+        """Test repeated calls reuse a single catalog scan."""
+        rag.vector_store.titles = ["Course A"]
+
+        first = rag.get_course_analytics()
+        second = rag.get_course_analytics()
+
+        assert first == second == {"total_courses": 1, "course_titles": ["Course A"]}
+        assert rag.vector_store.catalog_reads == 1
+
+    def test_result_is_a_copy(self, rag):
+        """Test mutating a returned result does not leak into later calls."""
+        rag.vector_store.titles = ["Course A"]
+
+        rag.get_course_analytics()["course_titles"].append("Injected")
+
+        assert rag.get_course_analytics()["course_titles"] == ["Course A"]
+
+    def test_add_course_document_invalidates(self, rag, tmp_path):
+        """Test adding a document refreshes the analytics."""
+        rag.vector_store.titles = ["Course A"]
+        rag.get_course_analytics()
+
+        rag.add_course_document(str(write_course(tmp_path, "Course B")))
+
+        assert rag.get_course_analytics() == {
+            "total_courses": 2,
+            "course_titles": ["Course A", "Course B"]
+        }
+
+    def test_add_course_folder_invalidates(self, rag, temp_docs_dir):
+        """Test adding a folder refreshes the analytics."""
+        rag.vector_store.titles = ["Course A"]
+        rag.get_course_analytics()
+
+        rag.add_course_folder(str(temp_docs_dir))
+
+        assert rag.get_course_analytics()["course_titles"] == ["Course A", "Sample Course"]
+
+    def test_clear_existing_invalidates(self, rag, tmp_path):
+        """Test clearing the catalog refreshes the analytics, even for a missing folder."""
+        rag.vector_store.titles = ["Course A"]
+        rag.get_course_analytics()
+
+        rag.add_course_folder(str(tmp_path / "missing"), clear_existing=True)
+
+        assert rag.get_course_analytics()["total_courses"] == 0
+
+    def test_failed_read_is_not_cached(self, rag):
+        """Test an empty scan caused by a read error is retried on the next call."""
+        rag.vector_store.titles = ["Course A"]
+        rag.vector_store.fail_next_read = True
+
+        assert rag.get_course_analytics()["total_courses"] == 0
+        assert rag.get_course_analytics()["total_courses"] == 1
+
+    def test_failed_content_write_invalidates(self, rag, tmp_path):
+        """Test a course whose content write fails still shows up once cataloged."""
+        rag.vector_store.titles = ["Course A"]
+        rag.get_course_analytics()
+        rag.vector_store.fail_content_write = True
+
+        course, chunk_count = rag.add_course_document(str(write_course(tmp_path, "Course B")))
+
+        assert (course, chunk_count) == (None, 0)
+        assert rag.get_course_analytics()["course_titles"] == ["Course A", "Course B"]